@@ -1,10 +1,64 @@
 import streamlit as st
-import re
+import json
 import random
+import string
 import streamlit.components.v1 as components
 
+# --- Shared character alphabets & OS-backed random source ---
+_UPPER = string.ascii_uppercase
+_LOWER = string.ascii_lowercase
+_DIGITS = string.digits
+_SPECIALS = '!@#$%^&*'
+_ALL_CHARS = _UPPER + _LOWER + _DIGITS + _SPECIALS
+_REQUIRED_BYTES = tuple(group.encode('ascii') for group in (_UPPER, _LOWER, _DIGITS, _SPECIALS))
+_ALL_BYTES = _ALL_CHARS.encode('ascii')
+_rng = random.SystemRandom()
+
+# --- Character-class bits (one per required class) ---
+_UPPER_BIT = 1
+_LOWER_BIT = 2
+_DIGIT_BIT = 4
+_SPECIAL_BIT = 8
+_CLASS_BITS = _UPPER_BIT | _LOWER_BIT | _DIGIT_BIT | _SPECIAL_BIT
+
+# --- Other issue bits & feedback messages (in display order) ---
+# _FEEDBACK keys are failed-criterion bits: a class bit there means the class is missing
+_SHORT_BIT = 16
+_SEQUENTIAL_BIT = 32
+_REPEATED_BIT = 64
+_FEEDBACK = (
+    (_SHORT_BIT, "Password should be at least 8 characters long"),
+    (_UPPER_BIT, "Include uppercase letters"),
+    (_LOWER_BIT, "Include lowercase letters"),
+    (_DIGIT_BIT, "Add at least one number (0-9)"),
+    (_SPECIAL_BIT, "Include at least one special character (!@#$%^&*)"),
+    (_SEQUENTIAL_BIT, "Avoid sequential characters (e.g., 'abc', '123')"),
+    (_REPEATED_BIT, "Avoid repeated characters (e.g., 'aaa', '111')"),
+)
+
+# Byte -> class bit lookup table, applied with bytes.translate
+_CAT_TABLE = bytes(
+    _UPPER_BIT if chr(b) in _UPPER else
+    _LOWER_BIT if chr(b) in _LOWER else
+    _DIGIT_BIT if chr(b) in _DIGITS else
+    _SPECIAL_BIT if chr(b) in _SPECIALS else
+    0
+    for b in range(256)
+)
+
+# --- Common password blocklist ---
+_COMMON_PASSWORDS = frozenset({
+    'password', '123456', '12345678', 'qwerty', 'abc123',
+    'password1', 'admin', 'letmein', 'welcome', 'monkey',
+    'sunshine', 'password123', 'football', 'iloveyou',
+    '1234567', '1234567890', '123123', '12345', '1234',
+    '111111', '000000', 'passw0rd'
+})
+
 # --- Helper function for clipboard copy (no alert) ---
 def copy_to_clipboard(text):
+    # JSON-encode for a safe JS string literal; escape "<" so "</script>" can't close the tag
+    safe_text = json.dumps(text).replace("<", "\\u003c")
     components.html(f"""
     <style>
         .copy-btn {{
@@ -21,106 +75,83 @@ def copy_to_clipboard(text):
     </style>
     <script>
     function copyText() {{
-        const text = `{text}`;
-        navigator.clipboard.writeText(text);
+        navigator.clipboard.writeText({safe_text});
     }}
     </script>
     <button class="copy-btn" onclick="copyText()">📋 Copy to Clipboard</button>
     """, height=100)
 
-# --- Sequential character check ---
-def has_sequential_chars(s, min_length=3):
-    for i in range(len(s) - min_length + 1):
-        current_slice = s[i:i+min_length]
-        is_ascending = all(
-            ord(current_slice[j]) - ord(current_slice[j-1]) == 1
-            for j in range(1, min_length)
-        )
-        is_descending = all(
-            ord(current_slice[j-1]) - ord(current_slice[j]) == 1
-            for j in range(1, min_length)
-        )
-        if is_ascending or is_descending:
-            return True
-    return False
-
-# --- Repeated character check ---
-def has_repeated_chars(s, min_length=3):
-    for i in range(len(s) - min_length + 1):
-        current_slice = s[i:i+min_length]
-        if len(set(current_slice)) == 1:
-            return True
-    return False
+# --- Sequential & repeated character scan (single pass) ---
+# Takes an iterable of character codes: ASCII bytes or map(ord, s)
+def _scan_patterns(codes, min_length=3):
+    has_seq = has_rep = False
+    asc_run = desc_run = eq_run = 1
+    codes = iter(codes)
+    prev = next(codes, None)
+    for code in codes:
+        d = code - prev
+        prev = code
+        asc_run = asc_run + 1 if d == 1 else 1
+        desc_run = desc_run + 1 if d == -1 else 1
+        eq_run = eq_run + 1 if d == 0 else 1
+        if asc_run >= min_length or desc_run >= min_length:
+            has_seq = True
+        if eq_run >= min_length:
+            has_rep = True
+        if has_seq and has_rep:
+            break
+    return has_seq, has_rep
 
 # --- Generate strong password ---
 def generate_strong_password(length=12):
-    uppercase = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    lowercase = 'abcdefghijklmnopqrstuvwxyz'
-    digits = '0123456789'
-    specials = '!@#$%^&*'
-    password = [
-        random.choice(uppercase),
-        random.choice(lowercase),
-        random.choice(digits),
-        random.choice(specials)
-    ]
-    all_chars = uppercase + lowercase + digits + specials
-    for _ in range(length - 4):
-        password.append(random.choice(all_chars))
-    random.shuffle(password)
-    return ''.join(password)
-
-# --- Password strength check ---
+    # Indexing bytes yields ints, so the buffer holds no per-char str objects
+    buf = bytearray(_rng.choice(group) for group in _REQUIRED_BYTES)
+    buf.extend(_rng.choices(_ALL_BYTES, k=length - 4))
+    _rng.shuffle(buf)
+    return buf.decode('ascii')
+
+# --- Password strength check (pure) ---
+# Returns a score of None for blocklisted passwords; the caller reports it.
 def check_password_strength(password):
-    common_passwords = [
-        'password', '123456', '12345678', 'qwerty', 'abc123',
-        'password1', 'admin', 'letmein', 'welcome', 'monkey',
-        'sunshine', 'password123', 'football', 'iloveyou',
-        '1234567', '1234567890', '123123', '12345', '1234',
-        '111111', '000000', 'passw0rd'
-    ]
-    score = 0
-    feedback = []
-
-    if password.lower() in common_passwords:
-        st.error("This password is too common and easily guessable. Please choose a different one.")
-        return 0, feedback
-
-    if len(password) >= 8:
-        score += 1
-    else:
-        feedback.append("Password should be at least 8 characters long")
-
-    if re.search(r"[A-Z]", password):
-        score += 1
-    else:
-        feedback.append("Include uppercase letters")
-
-    if re.search(r"[a-z]", password):
-        score += 1
-    else:
-        feedback.append("Include lowercase letters")
-
-    if re.search(r"\d", password):
-        score += 1
-    else:
-        feedback.append("Add at least one number (0-9)")
-
-    if re.search(r"[!@#$%^&*]", password):
-        score += 1
-    else:
-        feedback.append("Include at least one special character (!@#$%^&*)")
-
-    if has_sequential_chars(password):
-        feedback.append("Avoid sequential characters (e.g., 'abc', '123')")
-        score -= 1
-
-    if has_repeated_chars(password):
-        feedback.append("Avoid repeated characters (e.g., 'aaa', '111')")
-        score -= 1
-
-    score = max(0, score)
-    return score, feedback
+    if password.lower() in _COMMON_PASSWORDS:
+        return None, []
+
+    # Encode once: ASCII bytes feed both the class table and the pattern scan
+    is_ascii = password.isascii()
+    raw = password.encode('ascii') if is_ascii else password.encode('latin-1', 'replace')
+
+    seen = 0
+    for flag in set(raw.translate(_CAT_TABLE)):
+        seen |= flag
+    # Count Unicode Nd digits as numbers too; the table only covers 0-9
+    if not seen & _DIGIT_BIT and not is_ascii:
+        if any(c.isdecimal() for c in password):
+            seen |= _DIGIT_BIT
+
+    # One bit per failed criterion; each costs a point out of 5
+    issues = _CLASS_BITS & ~seen
+    if len(password) < 8:
+        issues |= _SHORT_BIT
+
+    # Runs need at least 3 characters, so skip the scan while typing starts
+    if len(password) >= 3:
+        has_seq, has_rep = _scan_patterns(raw if is_ascii else map(ord, password))
+        if has_seq:
+            issues |= _SEQUENTIAL_BIT
+        if has_rep:
+            issues |= _REPEATED_BIT
+
+    if not issues:
+        return 5, []
+    score = max(0, 5 - issues.bit_count())
+    return score, [message for bit, message in _FEEDBACK if issues & bit]
+
+# --- Example password callbacks (run before the rerun draws widgets) ---
+def _new_example():
+    st.session_state.example_password = generate_strong_password()
+
+def _clear_example():
+    st.session_state.pop('example_password', None)
 
 # --- Main App ---
 def main():
@@ -131,7 +162,10 @@ def main():
     with st.container():
         col1, col2 = st.columns([3, 1])
         with col1:
-            password = st.text_input("Enter your password:", type="password")
+            # A form only reruns the script on submit, not on every edit
+            with st.form("pw_form"):
+                password = st.text_input("Enter your password:", type="password")
+                st.form_submit_button("🔍 Analyze", on_click=_clear_example)
         with col2:
             st.markdown("<br>", unsafe_allow_html=True)
             generate_btn = st.button("✨ Generate Strong Password")
@@ -148,6 +182,10 @@ def main():
         with st.spinner("Analyzing password..."):
             score, feedback = check_password_strength(password)
 
+        if score is None:
+            st.error("This password is too common and easily guessable. Please choose a different one.")
+            score = 0
+
         st.markdown("---")
         st.subheader("Security Analysis")
 
@@ -178,10 +216,13 @@ def main():
 
         if score < 5:
             st.markdown("---")
-            if st.button("🛠 Show Strong Password Example"):
-                example_pass = generate_strong_password()
-                st.code(example_pass, language="bash")
-                copy_to_clipboard(example_pass)
+            # Callbacks update the example before this rerun draws the buttons
+            if 'example_password' not in st.session_state:
+                st.button("🛠 Show Strong Password Example", on_click=_new_example)
+            else:
+                st.button("🔄 Regenerate Example", on_click=_new_example)
+                st.code(st.session_state.example_password, language="bash")
+                copy_to_clipboard(st.session_state.example_password)
 
     st.markdown("---")
     with st.expander("ℹ About This Tool"):
@@ -190,7 +231,7 @@ def main():
         - Basic security requirements check
         - Common password detection
         - Pattern analysis (sequences & repetitions)
-        - Real-time strength meter
+        - Strength meter on submit
         - One-click password generation
         - Clipboard copy support (no external tool needed)
 